@@ -1 +1,3 @@
-from . import agent
\ No newline at end of file
+from . import agent
+
+__all__ = ["agent"]
@@ -4,24 +4,51 @@ This agent can search Google for information and provide sources with links.
 Uses the built-in google_search tool from google.adk.tools.
 """
 import os
+import asyncio
+import functools
 import logging
-from typing import Dict
+import logging.config
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Optional
+from weakref import WeakValueDictionary
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import StreamingResponse
 from ag_ui_adk import ADKAgent
 from ag_ui.core.types import RunAgentInput
 from ag_ui.encoder import EventEncoder
-from ag_ui.core import RunErrorEvent, EventType
+from ag_ui.core import BaseEvent, RunErrorEvent, EventType
+from pydantic_core import PydanticSerializationError
 from google.adk.agents import LlmAgent
 from google.adk.tools.agent_tool import AgentTool
 from google.adk.tools import google_search
 from dotenv import load_dotenv
 
+try:
+    # Native SSE support (FastAPI 0.135+): framing, keep-alive pings and
+    # proxy-friendly headers are handled by FastAPI itself.
+    from fastapi.sse import EventSourceResponse, ServerSentEvent
+except ImportError:
+    # Older FastAPI: fall back to StreamingResponse + EventEncoder framing
+    EventSourceResponse = ServerSentEvent = None
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.config.dictConfig({
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "()": "logging.Formatter",
+            "format": "%(asctime)s %(levelname)s %(name)s %(message)s",
+        },
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "default"},
+    },
+    "root": {"level": "INFO", "handlers": ["console"]},
+})
 logger = logging.getLogger(__name__)
 
 """Financial coordinator: provide reasonable investment strategies."""
@@ -34,10 +61,9 @@ from sub_agents.trading_analyst import trading_analyst_agent
 
 
 
-def create_agent(thread_id: str) -> ADKAgent:
-    """Create a new agent instance for a specific thread."""
-    # Create the ADK Agent with the built-in Google Search Tool
-    financial_coordinator = LlmAgent(
+# The coordinator graph is identical for every thread (ADK keeps per-user state
+# in the session service), so it is built once and shared by all sessions.
+financial_coordinator = LlmAgent(
     name="financial_coordinator",
     model=MODEL,
     description=(
@@ -55,9 +81,12 @@ def create_agent(thread_id: str) -> ADKAgent:
         AgentTool(agent=execution_analyst_agent),
         AgentTool(agent=risk_analyst_agent),
     ],
-    )
+)
+
 
-    # Create ADK middleware agent instance
+def create_agent(thread_id: str) -> ADKAgent:
+    """Create a new agent instance for a specific thread."""
+    # Create ADK middleware agent instance around the shared coordinator
     return ADKAgent(
         adk_agent=financial_coordinator,
         app_name="finacial_advisor_app",
@@ -67,15 +96,29 @@ def create_agent(thread_id: str) -> ADKAgent:
     )
 
 class SessionManager:
-    """Manages agent sessions by thread ID."""
-    def __init__(self):
-        self.sessions: Dict[str, ADKAgent] = {}
+    """Manages agent sessions by thread ID.
+
+    Sessions are kept in LRU order and capped at ``max_sessions``; a per-thread
+    lock makes sure concurrent first requests for a thread build one agent.
+    """
+    def __init__(self, max_sessions: int = 1024):
+        self.sessions: OrderedDict[str, ADKAgent] = OrderedDict()
+        self._locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+        self._max = max_sessions
 
-    def get_agent(self, thread_id: str) -> ADKAgent:
-        if thread_id not in self.sessions:
-            print(f"✨ Creating new agent session for thread: {thread_id}")
-            self.sessions[thread_id] = create_agent(thread_id)
-        return self.sessions[thread_id]
+    async def get_agent(self, thread_id: str) -> ADKAgent:
+        lock = self._locks.setdefault(thread_id, asyncio.Lock())
+        async with lock:
+            if thread_id in self.sessions:
+                self.sessions.move_to_end(thread_id)
+                return self.sessions[thread_id]
+            logger.info("✨ Creating new agent session for thread: %s", thread_id)
+            agent = create_agent(thread_id)
+            self.sessions[thread_id] = agent
+            if len(self.sessions) > self._max:
+                # Evict the least recently used session
+                self.sessions.popitem(last=False)
+            return agent
 
 # Initialize Session Manager
 session_manager = SessionManager()
@@ -87,66 +130,183 @@ app = FastAPI(
     version="1.0.0"
 )
 
-@app.post("/")
-async def handle_request(input_data: RunAgentInput, request: Request):
-    """Handle incoming requests and route to the appropriate agent session."""
-    # Extract thread_id from header
-    thread_id = request.headers.get("x-thread-id", "default_thread")
-    logger.info(f"🔵 Agent - Received request for thread_id: {thread_id}")
-    
-    # Get or create agent for this thread
-    agent = session_manager.get_agent(thread_id)
-    
-    # Get the accept header from the request
-    accept_header = request.headers.get("accept")
-    
-    # Create an event encoder to properly format SSE events
-    encoder = EventEncoder(accept=accept_header)
-    
-    async def event_generator():
-        """Generate events from ADK agent."""
+class EventEncodingError(Exception):
+    """Raised by an event encoder when an AG-UI event cannot be serialized."""
+
+
+# Pre-encoded SSE frames yielded when even a RunErrorEvent cannot be encoded
+_SSE_ENCODING_ERROR = b"event: error\ndata: {\"error\": \"Event encoding failed\"}\n\n"
+_SSE_AGENT_ERROR = b"event: error\ndata: {\"error\": \"Agent execution failed\"}\n\n"
+
+# Exceptions pydantic can raise while serializing or validating an event
+_SERIALIZATION_ERRORS = (PydanticSerializationError, TypeError, ValueError)
+
+
+class FastEventEncoder(EventEncoder):
+    """EventEncoder that writes SSE frames as bytes.
+
+    The event JSON comes straight out of pydantic-core as bytes, skipping the
+    intermediate ``str`` and the f-string copy that the base encoder builds and
+    the ASGI layer later re-encodes.
+    """
+
+    def encode(self, event: BaseEvent) -> bytes:
+        try:
+            if self.get_content_type() != "text/event-stream":
+                return super().encode(event)
+            payload = event.__pydantic_serializer__.to_json(event, by_alias=True)
+        except _SERIALIZATION_ERRORS as e:
+            raise EventEncodingError(str(e)) from e
+        return b"data: " + payload + b"\n\n"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoder(accept: Optional[str]) -> FastEventEncoder:
+    """Return a shared FastEventEncoder for an Accept header.
+
+    EventEncoder keeps no state between ``encode()`` calls, so one instance per
+    distinct header can serve every request.
+    """
+    return FastEventEncoder(accept=accept)
+
+
+def _header(request: Request, name: bytes, default: Optional[str] = None) -> Optional[str]:
+    """Read one header straight from the ASGI scope (names are lower-case bytes).
+
+    Avoids building Starlette's ``Headers`` wrapper for the one or two values
+    each request needs.
+    """
+    return next(
+        (value.decode("latin-1") for key, value in request.scope["headers"] if key == name),
+        default,
+    )
+
+
+async def event_generator(
+    agent: ADKAgent,
+    input_data: RunAgentInput,
+    encode: Callable[[BaseEvent], Any],
+    encoding_error_frame: Any,
+    agent_error_frame: Any,
+) -> AsyncIterator[Any]:
+    """Generate encoded events from ADK agent.
+
+    ``encode`` turns each AG-UI event into a transport frame and raises
+    EventEncodingError when it cannot. The two ``*_error_frame`` values are
+    yielded as-is when even the RunErrorEvent describing a failure cannot be
+    encoded.
+    """
+    try:
+        async for event in agent.run(input_data):
+            encoded = encode(event)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("HTTP Response: %s", encoded)
+            yield encoded
+    except EventEncodingError as encoding_error:
+        # Handle encoding-specific errors; the stream stops here
+        logger.error("❌ Event encoding error: %s", encoding_error, exc_info=True)
+        # Create a RunErrorEvent for encoding failures
+        error_event = RunErrorEvent(
+            type=EventType.RUN_ERROR,
+            message=f"Event encoding failed: {str(encoding_error)}",
+            code="ENCODING_ERROR"
+        )
+        try:
+            error_encoded = encode(error_event)
+            yield error_encoded
+        except EventEncodingError:
+            # If we can't even encode the error event, yield a basic SSE error
+            logger.error("Failed to encode error event, yielding basic SSE error")
+            yield encoding_error_frame
+    except Exception as agent_error:
+        # Handle errors from ADKAgent.run() itself
+        logger.error("❌ ADKAgent error: %s", agent_error, exc_info=True)
+        # ADKAgent should have yielded a RunErrorEvent, but if something went wrong
+        # in the async generator itself, we need to handle it
+        try:
+            error_event = RunErrorEvent(
+                type=EventType.RUN_ERROR,
+                message=f"Agent execution failed: {str(agent_error)}",
+                code="AGENT_ERROR"
+            )
+            error_encoded = encode(error_event)
+            yield error_encoded
+        except Exception:
+            # If we can't encode the error event, yield a basic SSE error
+            logger.error("Failed to encode agent error event, yielding basic SSE error")
+            yield agent_error_frame
+
+
+if EventSourceResponse is not None:
+
+    def _to_server_sent_event(event: BaseEvent) -> ServerSentEvent:
+        # AG-UI clients expect camelCase keys, which plain ``data=event`` would
+        # not produce, so hand FastAPI the serialized JSON as raw data.
         try:
-            async for event in agent.run(input_data):
-                try:
-                    encoded = encoder.encode(event)
-                    logger.debug(f"HTTP Response: {encoded}")
-                    yield encoded
-                except Exception as encoding_error:
-                    # Handle encoding-specific errors
-                    logger.error(f"❌ Event encoding error: {encoding_error}", exc_info=True)
-                    # Create a RunErrorEvent for encoding failures
-                    error_event = RunErrorEvent(
-                        type=EventType.RUN_ERROR,
-                        message=f"Event encoding failed: {str(encoding_error)}",
-                        code="ENCODING_ERROR"
-                    )
-                    try:
-                        error_encoded = encoder.encode(error_event)
-                        yield error_encoded
-                    except Exception:
-                        # If we can't even encode the error event, yield a basic SSE error
-                        logger.error("Failed to encode error event, yielding basic SSE error")
-                        yield "event: error\ndata: {\"error\": \"Event encoding failed\"}\n\n"
-                    break  # Stop the stream after an encoding error
-        except Exception as agent_error:
-            # Handle errors from ADKAgent.run() itself
-            logger.error(f"❌ ADKAgent error: {agent_error}", exc_info=True)
-            # ADKAgent should have yielded a RunErrorEvent, but if something went wrong
-            # in the async generator itself, we need to handle it
-            try:
-                error_event = RunErrorEvent(
-                    type=EventType.RUN_ERROR,
-                    message=f"Agent execution failed: {str(agent_error)}",
-                    code="AGENT_ERROR"
-                )
-                error_encoded = encoder.encode(error_event)
-                yield error_encoded
-            except Exception:
-                # If we can't encode the error event, yield a basic SSE error
-                logger.error("Failed to encode agent error event, yielding basic SSE error")
-                yield "event: error\ndata: {\"error\": \"Agent execution failed\"}\n\n"
-    
-    return StreamingResponse(event_generator(), media_type=encoder.get_content_type())
+            return ServerSentEvent(raw_data=event.model_dump_json(by_alias=True))
+        except _SERIALIZATION_ERRORS as e:
+            raise EventEncodingError(str(e)) from e
+
+    _SSE_EVENT_ENCODING_ERROR = ServerSentEvent(
+        event="error", raw_data='{"error": "Event encoding failed"}'
+    )
+    _SSE_EVENT_AGENT_ERROR = ServerSentEvent(
+        event="error", raw_data='{"error": "Agent execution failed"}'
+    )
+
+    @app.post("/", response_class=EventSourceResponse)
+    async def handle_request(
+        input_data: RunAgentInput, request: Request
+    ) -> AsyncIterator[ServerSentEvent]:
+        """Handle incoming requests and route to the appropriate agent session.
+
+        FastAPI does the SSE framing, sends keep-alive pings while the agent is
+        idle and sets the no-cache / ``X-Accel-Buffering: no`` headers.
+        """
+        # Extract thread_id from header
+        thread_id = _header(request, b"x-thread-id", "default_thread")
+        logger.info("🔵 Agent - Received request for thread_id: %s", thread_id)
+
+        # Get or create agent for this thread
+        agent = await session_manager.get_agent(thread_id)
+
+        async for frame in event_generator(
+            agent,
+            input_data,
+            _to_server_sent_event,
+            encoding_error_frame=_SSE_EVENT_ENCODING_ERROR,
+            agent_error_frame=_SSE_EVENT_AGENT_ERROR,
+        ):
+            yield frame
+
+else:
+
+    @app.post("/")
+    async def handle_request(input_data: RunAgentInput, request: Request):
+        """Handle incoming requests and route to the appropriate agent session."""
+        # Extract thread_id from header
+        thread_id = _header(request, b"x-thread-id", "default_thread")
+        logger.info("🔵 Agent - Received request for thread_id: %s", thread_id)
+
+        # Get or create agent for this thread
+        agent = await session_manager.get_agent(thread_id)
+
+        # Get the accept header from the request
+        accept_header = _header(request, b"accept")
+
+        # Reuse the cached event encoder for this Accept header
+        encoder = _get_encoder(accept_header)
+
+        return StreamingResponse(
+            event_generator(
+                agent,
+                input_data,
+                encoder.encode,
+                encoding_error_frame=_SSE_ENCODING_ERROR,
+                agent_error_frame=_SSE_AGENT_ERROR,
+            ),
+            media_type=encoder.get_content_type(),
+        )
 
 # Health check endpoint
 @app.get("/health")
@@ -166,4 +326,17 @@ if __name__ == "__main__":
     print(f"🚀 Starting Financial Advisor ADK Agent on http://localhost:{port}")
     print(f"📝 Health check: http://localhost:{port}/health")
     print(f"🔍 Agent endpoint: http://localhost:{port}/")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvicorn's "auto" loop/http pick uvloop and httptools when installed
+    # (uvicorn[standard]). Each worker keeps its own SessionManager, so with
+    # AGENT_WORKERS > 1 a load balancer must route by x-thread-id.
+    workers = int(os.getenv("AGENT_WORKERS", "1"))
+    # A single worker serves this already-imported app; only worker processes
+    # need the import string, which would otherwise load this module twice
+    uvicorn.run(
+        app if workers == 1 else "agent:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        log_level="warning",
+        access_log=False,
+    )
@@ -0,0 +1,25 @@
+"""Report where the ag_ui symbols used by agent.py can be imported from."""
+import importlib
+
+# (module, attribute) pairs to check; a direct import instead of walking ag_ui
+LOCATIONS = [
+    ("ag_ui.encoder", "EventEncoder"),
+    ("ag_ui.core.types", "RunAgentInput"),
+]
+
+
+def main():
+    for module_name, class_name in LOCATIONS:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            print(f"Not in {module_name}")
+            continue
+        if hasattr(module, class_name):
+            print(f"Found {class_name} in {module_name}")
+        else:
+            print(f"{class_name} not in {module_name}")
+
+
+if __name__ == "__main__":
+    main()
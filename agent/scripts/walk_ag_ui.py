@@ -0,0 +1,36 @@
+"""Locate the ag_ui module that provides EventEncoder."""
+import functools
+import importlib
+import pkgutil
+
+
+@functools.lru_cache(maxsize=1)
+def find_event_encoder():
+    """Return the EventEncoder class, falling back to scanning ag_ui if it has moved."""
+    try:
+        from ag_ui.encoder import EventEncoder
+        return EventEncoder
+    except ImportError:
+        pass
+
+    import ag_ui
+    for importer, modname, ispkg in pkgutil.walk_packages(ag_ui.__path__, ag_ui.__name__ + "."):
+        try:
+            module = importlib.import_module(modname)
+        except Exception:
+            continue
+        if hasattr(module, "EventEncoder"):
+            return module.EventEncoder
+    return None
+
+
+def main():
+    encoder = find_event_encoder()
+    if encoder is None:
+        print("EventEncoder not found in ag_ui")
+    else:
+        print(f"Found EventEncoder in {encoder.__module__}")
+
+
+if __name__ == "__main__":
+    main()
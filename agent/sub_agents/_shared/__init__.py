@@ -0,0 +1 @@
+"""Helpers shared by the financial advisor sub-agents"""
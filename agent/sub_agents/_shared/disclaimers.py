@@ -0,0 +1,19 @@
+"""Prompt fragments shared by the sub-agent prompts"""
+
+LEGAL_DISCLAIMER_HEADING = (
+    "** Legal Disclaimer and User Acknowledgment (MUST be displayed prominently):\n"
+    '"Important Disclaimer: For Educational and Informational Purposes Only." '
+)
+
+LEGAL_DISCLAIMER_CLOSING = (
+    "Always consult with a qualified financial advisor before making investment "
+    "decisions. Google and its affiliates make no warranties and are not liable "
+    "for any losses arising from use of this information."
+)
+
+
+def legal_disclaimer(summary: str) -> str:
+    """Build the closing legal disclaimer section around an agent-specific summary."""
+    return "".join(
+        [LEGAL_DISCLAIMER_HEADING, '"', summary, " ", LEGAL_DISCLAIMER_CLOSING, '"\n']
+    )
@@ -0,0 +1,39 @@
+"""Read prompt text shipped as package data"""
+
+import mmap
+from importlib.resources import as_file, files
+from typing import Any, Callable, Dict
+
+
+def read_prompt(package: str, filename: str) -> str:
+    """Return the UTF-8 text of ``filename`` inside ``package``.
+
+    The file is mapped read-only and decoded straight from the mapping, so
+    the page cache backs the read and no intermediate ``bytes`` copy is made.
+    """
+    with as_file(files(package).joinpath(filename)) as path, open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
+def install_lazy_prompts(namespace: Dict[str, Any], builders: Dict[str, Callable[[], str]]) -> None:
+    """Expose each prompt in ``builders`` as a module attribute built on first access.
+
+    Installs a PEP 562 ``__getattr__`` into the module ``namespace`` (pass the
+    module's ``globals()``). The built text is stored back into the namespace, so
+    later lookups are plain attribute reads. Agents pass ``instruction`` as a
+    callable that reads the attribute, so nothing is read from disk until the
+    sub-agent actually runs.
+    """
+    module_name = namespace["__name__"]
+
+    def __getattr__(name):
+        try:
+            build = builders[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        text = build()
+        namespace[name] = text
+        return text
+
+    namespace["__getattr__"] = __getattr__
@@ -21,15 +21,17 @@ from . import prompt
 from tools.yfinance_tools import (
     get_stock_price, 
     get_historical_data,
+    get_technical_levels,
 )
 
 execution_analyst_agent = Agent(
     model=MODEL,
     name="execution_analyst_agent",
-    instruction=prompt.EXECUTION_ANALYST_PROMPT,
+    instruction=lambda _ctx: prompt.EXECUTION_ANALYST_PROMPT,
     output_key="execution_plan_output",
     tools=[
         FunctionTool(get_stock_price),
         FunctionTool(get_historical_data),
+        FunctionTool(get_technical_levels),
     ],
 )
\ No newline at end of file
@@ -27,7 +27,7 @@ from tools.yfinance_tools import (
 risk_analyst_agent = Agent(
     model=MODEL,
     name="risk_analyst_agent",
-    instruction=prompt.RISK_ANALYST_PROMPT,
+    instruction=lambda _ctx: prompt.RISK_ANALYST_PROMPT,
     output_key="final_risk_assessment_output",
     tools=[
         FunctionTool(get_stock_price),
@@ -18,20 +18,32 @@ from google.adk import Agent
 from google.adk.tools import FunctionTool
 from config import MODEL
 from . import prompt
+from tools.batch import get_ticker_bundle
 from tools.yfinance_tools import (
     get_stock_price, 
     get_historical_data,
-    get_financial_info
+    get_financial_info,
+    get_technical_levels,
+    get_quote_with_history,
+    get_stock_prices_batch,
+    get_financial_info_batch,
+    get_historical_data_batch,
 )
 
 trading_analyst_agent = Agent(
     model=MODEL,
     name="trading_analyst_agent",
-    instruction=prompt.TRADING_ANALYST_PROMPT,
+    instruction=lambda _ctx: prompt.TRADING_ANALYST_PROMPT,
     output_key="proposed_trading_strategies_output",
     tools=[
+        FunctionTool(get_ticker_bundle),
         FunctionTool(get_stock_price),
         FunctionTool(get_historical_data),
         FunctionTool(get_financial_info),
+        FunctionTool(get_technical_levels),
+        FunctionTool(get_quote_with_history),
+        FunctionTool(get_stock_prices_batch),
+        FunctionTool(get_financial_info_batch),
+        FunctionTool(get_historical_data_batch),
     ],
 )
\ No newline at end of file
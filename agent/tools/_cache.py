@@ -0,0 +1,183 @@
+"""
+On-disk TTL cache for yfinance tool responses.
+
+Entries are JSON files keyed by an MD5 hash of the tool name and its arguments,
+with a small in-memory layer in front so repeated calls within one process skip
+the disk read as well.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from tools import _json
+
+# Where cached responses are written; defaults to agent/.cache/yfinance
+CACHE_DIR = Path(
+    os.getenv("YFINANCE_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache" / "yfinance")
+)
+
+
+def make_key(name: str, arguments: Dict[str, Any]) -> str:
+    """Build a stable cache key for a call of ``name`` with ``arguments``."""
+    payload = json.dumps([name, arguments], sort_keys=True, default=str)
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+
+class FileCache:
+    """
+    JSON file cache with a bounded in-memory LRU in front of it.
+
+    Each entry records when it was stored; callers pass the TTL they accept on
+    ``get``, so tools with different freshness needs can share one cache.
+    Writes are best-effort: a read-only or full disk only disables persistence.
+
+    Expired entries are deleted when they are read. Because argument
+    combinations that are never requested again would otherwise stay on disk
+    forever, ``set`` also sweeps the directory at most once per
+    ``prune_interval`` seconds and removes files older than ``max_age``, which
+    should be at least the longest TTL in use.
+    """
+
+    def __init__(
+        self,
+        directory: Path = CACHE_DIR,
+        memory_size: int = 256,
+        max_age: float = 24 * 60 * 60,
+        prune_interval: float = 60 * 60,
+    ):
+        self.directory = Path(directory)
+        self.memory_size = memory_size
+        self.max_age = max_age
+        self.prune_interval = prune_interval
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _remember(self, key: str, stored_at: float, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = (stored_at, value)
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Return the cached value for ``key`` if it is younger than ``ttl`` seconds."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    stored = _json.loads(f.read())
+                entry = (stored["stored_at"], stored["value"])
+            except (OSError, ValueError, KeyError):
+                return None
+            self._remember(key, *entry)
+
+        stored_at, value = entry
+        if now - stored_at >= ttl:
+            self._discard(key)
+            return None
+        return value
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    def prune(self) -> None:
+        """Delete cache files (and leftover temp files) older than ``max_age``."""
+        cutoff = time.time() - self.max_age
+        try:
+            paths = list(self.directory.iterdir())
+        except OSError:
+            return
+        for path in paths:
+            if path.suffix not in (".json", ".tmp"):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` (which must be JSON-serializable) under ``key``."""
+        stored_at = time.time()
+        self._remember(key, stored_at, value)
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json.dumps({"stored_at": stored_at, "value": value}))
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError):
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return
+
+        if stored_at - self._last_prune >= self.prune_interval:
+            self._last_prune = stored_at
+            self.prune()
+
+
+_default_cache = FileCache()
+
+
+def cached(ttl: float, cache: Optional[FileCache] = None) -> Callable:
+    """
+    Cache a yfinance tool's successful responses for ``ttl`` seconds.
+
+    The key covers every argument except ``tool_context``, with ``ticker``
+    upper-cased so "aapl" and "AAPL" share an entry. Responses containing an
+    ``error`` key are never cached. ``functools.wraps`` keeps the signature and
+    docstring that ADK's FunctionTool reads to build the tool declaration.
+    """
+
+    def decorator(func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            store = cache or _default_cache
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k != "tool_context"}
+            if isinstance(arguments.get("ticker"), str):
+                arguments["ticker"] = arguments["ticker"].upper()
+            key = make_key(func.__name__, arguments)
+
+            hit = store.get(key, ttl)
+            if hit is not None:
+                return hit
+
+            result = func(*args, **kwargs)
+            if isinstance(result, dict) and "error" not in result:
+                store.set(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,87 @@
+"""
+Technical indicator kernels over NumPy price arrays.
+
+The kernels are compiled with numba when it is installed (see
+requirements-optional.txt) and fall back to plain Python loops otherwise, so
+numba stays an optional dependency.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with arguments."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def sma(values, window):
+    """Simple moving average; entries before the first full window are NaN."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+@njit(cache=True)
+def rolling_min(values, window):
+    """Lowest value of each trailing window; NaN before the first full window."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        lowest = values[i]
+        for j in range(i - window + 1, i):
+            if values[j] < lowest:
+                lowest = values[j]
+        out[i] = lowest
+    return out
+
+
+@njit(cache=True)
+def rolling_max(values, window):
+    """Highest value of each trailing window; NaN before the first full window."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        highest = values[i]
+        for j in range(i - window + 1, i):
+            if values[j] > highest:
+                highest = values[j]
+        out[i] = highest
+    return out
+
+
+@njit(cache=True)
+def atr(high, low, close, window):
+    """Average True Range using Wilder's smoothing; NaN until ``window`` bars exist."""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    true_range = np.empty(n)
+    true_range[0] = high[0] - low[0]
+    for i in range(1, n):
+        true_range[i] = max(
+            high[i] - low[i],
+            abs(high[i] - close[i - 1]),
+            abs(low[i] - close[i - 1]),
+        )
+    value = 0.0
+    for i in range(window):
+        value += true_range[i]
+    value /= window
+    out[window - 1] = value
+    for i in range(window, n):
+        value = (value * (window - 1) + true_range[i]) / window
+        out[i] = value
+    return out
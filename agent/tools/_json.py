@@ -0,0 +1,39 @@
+"""
+JSON encoding for cached tool responses.
+
+Uses orjson when it is installed (see requirements-optional.txt) and falls
+back to the standard library otherwise, so orjson stays an optional dependency.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def _default(value: Any) -> Any:
+    """Convert NumPy scalars and arrays the encoders don't handle natively."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes; NaN and infinity become null."""
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON ``data`` (bytes or str)."""
+        return orjson.loads(data)
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes."""
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON ``data`` (bytes or str)."""
+        return json.loads(data)
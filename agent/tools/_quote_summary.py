@@ -0,0 +1,56 @@
+"""
+Direct access to Yahoo Finance's quoteSummary endpoint for selected modules.
+
+``Ticker.info`` always downloads five quoteSummary modules plus a second v7
+quote request. Tools that need only a few fields call :func:`fetch_modules`
+instead, which goes through yfinance's shared ``YfData`` session so the cookie
+and crumb handling stay yfinance's.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from yfinance.data import YfData
+
+QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary"
+
+
+def _format(value: Any) -> Any:
+    """Unwrap Yahoo's {"raw", "fmt"} pairs the same way Ticker.info does."""
+    if isinstance(value, dict) and "raw" in value:
+        return value["raw"]
+    if isinstance(value, list):
+        return [_format(item) for item in value]
+    if isinstance(value, dict):
+        return {k: _format(v) for k, v in value.items()}
+    if isinstance(value, str):
+        return value.replace("\xa0", " ")
+    return value
+
+
+def fetch_modules(ticker: str, modules: List[str], data: Optional[YfData] = None) -> Dict[str, Any]:
+    """
+    Fetch ``modules`` for ``ticker`` and flatten them into one info-style dict.
+
+    Keys keep the names Ticker.info uses. When several modules provide the same
+    key, the module listed first wins. Returns an empty dict if Yahoo has no
+    data for the symbol; HTTP errors propagate to the caller.
+    """
+    symbol = ticker.upper()
+    params = {
+        "modules": ",".join(modules),
+        "formatted": "false",
+        "corsDomain": "finance.yahoo.com",
+        "symbol": symbol,
+    }
+    result = (data or YfData()).get_raw_json(f"{QUOTE_SUMMARY_URL}/{symbol}", params=params)
+
+    results = (result.get("quoteSummary") or {}).get("result") or []
+    if not results:
+        return {}
+
+    info: Dict[str, Any] = {}
+    for module in modules:
+        for key, value in (results[0].get(module) or {}).items():
+            if value is not None and key not in info:
+                info[key] = _format(value)
+    return info
@@ -0,0 +1,54 @@
+"""
+Combined yfinance tools that run several independent fetches concurrently.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from google.adk.tools.tool_context import ToolContext
+
+from tools.yfinance_tools import get_financial_info, get_historical_data, get_stock_price
+
+
+def get_ticker_bundle(
+    ticker: str,
+    period: str = "6mo",
+    resample: Optional[str] = None,
+    tool_context: ToolContext = None
+) -> Dict[str, Any]:
+    """
+    Fetches the current quote, price history and financial information for a ticker in one call.
+    
+    The three lookups are independent, so they run in parallel and the call takes
+    about as long as the slowest one instead of all three back to back.
+    
+    Args:
+        ticker: The stock ticker symbol.
+        period: History period for the price data: 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max.
+        resample: Aggregate the price history into "W" (weekly) or "M" (monthly) bars (optional).
+        tool_context: The ADK ToolContext object.
+    
+    Returns:
+        A dictionary with "quote" (get_stock_price result), "history"
+        (get_historical_data result) and "financials" (get_financial_info result).
+    
+    Example:
+        {
+            "ticker": "AAPL",
+            "quote": {"currentPrice": 185.50, ...},
+            "history": {"period": "6mo", "data": [...]},
+            "financials": {"trailingPE": 28.5, ...}
+        }
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        quote = executor.submit(get_stock_price, ticker, tool_context)
+        history = executor.submit(
+            get_historical_data, ticker, period, resample=resample, tool_context=tool_context
+        )
+        financials = executor.submit(get_financial_info, ticker, tool_context)
+        return {
+            "ticker": ticker.upper(),
+            "quote": quote.result(),
+            "history": history.result(),
+            "financials": financials.result(),
+        }
@@ -3,12 +3,97 @@ YFinance tools for fetching stock market data using the yfinance library.
 Based on yfinance API: https://ranaroussi.github.io/yfinance/reference/index.html
 """
 
+import math
+import time
+from functools import lru_cache
 import yfinance as yf
 from google.adk.tools.tool_context import ToolContext
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, List, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 
+from tools import _indicators
+from tools._quote_summary import fetch_modules
+from tools._cache import cached
+
+# Cache lifetimes (seconds): quotes move constantly, bars and fundamentals slowly
+QUOTE_TTL = 60
+HISTORY_TTL = 60 * 60
+FUNDAMENTALS_TTL = 24 * 60 * 60
+
+# Price/volume columns returned by Ticker.history()
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Bar sizes accepted by get_historical_data(resample=...) -> pandas rule and label.
+# Resampled bars are dated by the last trading day they contain, not the rule's
+# period-end label, which can be a holiday or a date still in the future
+RESAMPLE_RULES = {
+    "W": ("W-FRI", "weekly"),
+    "M": ("ME", "monthly"),
+}
+
+# How daily bars are combined into one resampled bar
+OHLCV_AGGREGATION = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+# quoteSummary modules each tool reads, in order of precedence for shared keys
+STOCK_PRICE_MODULES = ["price", "summaryDetail"]
+FINANCIAL_INFO_MODULES = ["price", "assetProfile", "defaultKeyStatistics", "financialData", "summaryDetail"]
+
+# Upper bound on concurrent Yahoo Finance requests issued by the batch tools
+MAX_BATCH_WORKERS = 8
+
+
+def _finite_ohlcv(hist: pd.DataFrame) -> pd.DataFrame:
+    """Keep only rows where every OHLCV value is a finite number."""
+    return hist[np.isfinite(hist[OHLCV_COLUMNS].to_numpy(dtype=float)).all(axis=1)]
+
+
+def _ohlcv_frame(hist: pd.DataFrame) -> pd.DataFrame:
+    """Rounded date/open/high/low/close/volume frame ready for to_dict()."""
+    return pd.DataFrame({
+        "date": _date_strings(hist.index),
+        "open": hist["Open"].round(2).astype(float),
+        "high": hist["High"].round(2).astype(float),
+        "low": hist["Low"].round(2).astype(float),
+        "close": hist["Close"].round(2).astype(float),
+        "volume": hist["Volume"].astype("int64"),
+    })
+
+
+def _date_strings(index: pd.DatetimeIndex) -> np.ndarray:
+    """Format a DatetimeIndex as "YYYY-MM-DD" strings in its own (exchange-local) timezone."""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return np.datetime_as_string(index.values.astype("datetime64[D]"))
+
+
+def _float_or_none(column: pd.Series) -> pd.Series:
+    """Column values as float, with NaN/missing values as None."""
+    values = column.astype(float)
+    return values.astype(object).where(values.notna(), None)
+
+
+def _str_or_none(column: pd.Series) -> pd.Series:
+    """Column values as str, with NaN/missing values as None."""
+    return column.map(str, na_action="ignore").astype(object).where(column.notna(), None)
+
+
+@lru_cache(maxsize=256)
+def _cached_ticker(symbol: str, bucket: int) -> yf.Ticker:
+    return yf.Ticker(symbol)
+
+
+def _ticker(symbol: str) -> yf.Ticker:
+    """
+    Return a shared yf.Ticker for ``symbol``, reused for up to QUOTE_TTL seconds.
+    
+    A Ticker memoizes its timezone, history metadata, earnings and recommendations,
+    so reusing one saves those lookups across tool calls. Keying on a QUOTE_TTL time
+    bucket keeps those memoized attributes from outliving the response cache.
+    """
+    return _cached_ticker(symbol.upper(), int(time.time() // QUOTE_TTL))
+
 
 def safe_float(value):
     """
@@ -17,21 +102,57 @@ def safe_float(value):
     """
     if value is None:
         return None
-    try:
-        float_val = float(value)
-        # Check if it's NaN or infinity
-        if pd.isna(float_val) or float_val == float('inf') or float_val == float('-inf'):
+    if type(value) is not float:
+        try:
+            value = float(value)
+        except (ValueError, TypeError, OverflowError):
             return None
-        return float_val
-    except (ValueError, TypeError):
-        return None
+    # Reject NaN and infinity
+    return value if math.isfinite(value) else None
 
 
+def _pick_fields(info: Dict[str, Any], fields, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy whitelisted fields from an info dict into ``result`` in one pass.
+    
+    Each field is (output key, source keys, converter). The first source key with a
+    value that survives the converter (None = keep as-is) wins; fields without a
+    usable value are left out instead of being set to None.
+    """
+    for key, sources, convert in fields:
+        for source in sources:
+            value = info.get(source)
+            if value is not None and convert is not None:
+                value = convert(value)
+            if value is not None:
+                result[key] = value
+                break
+    return result
+
+
+# (output key, info keys in order of preference, converter) for get_stock_price
+STOCK_PRICE_FIELDS = (
+    ("currentPrice", ("currentPrice", "regularMarketPrice"), safe_float),
+    ("previousClose", ("previousClose",), safe_float),
+    ("open", ("regularMarketOpen", "open"), safe_float),
+    ("dayHigh", ("dayHigh",), safe_float),
+    ("dayLow", ("dayLow",), safe_float),
+    ("volume", ("volume",), safe_float),
+    ("marketCap", ("marketCap",), safe_float),
+    ("fiftyTwoWeekHigh", ("fiftyTwoWeekHigh",), safe_float),
+    ("fiftyTwoWeekLow", ("fiftyTwoWeekLow",), safe_float),
+    ("currency", ("currency",), None),
+    ("exchange", ("exchange",), None),
+    ("longName", ("longName", "shortName"), None),
+)
+
+
+@cached(ttl=QUOTE_TTL)
 def get_stock_price(ticker: str, tool_context: ToolContext) -> Dict[str, Any]:
     """
     Fetches the current stock price and key financial metrics for a given ticker symbol.
     
-    This tool uses the yfinance Ticker.info attribute to get real-time data including:
+    This tool reads the price and summaryDetail quoteSummary modules to get real-time data including:
     - Current/regular market price
     - Previous close
     - Day's range (high/low)
@@ -50,8 +171,7 @@ def get_stock_price(ticker: str, tool_context: ToolContext) -> Dict[str, Any]:
         {"ticker": "AAPL", "currentPrice": 185.50, "previousClose": 184.20, ...}
     """
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = fetch_modules(ticker, STOCK_PRICE_MODULES)
         
         if not info or len(info) == 0:
             return {
@@ -59,25 +179,9 @@ def get_stock_price(ticker: str, tool_context: ToolContext) -> Dict[str, Any]:
                 "error": "No data available for this ticker. Please verify the ticker symbol is correct."
             }
         
-        # Extract key price and market data with safe_float to handle NaN
-        result = {
-            "ticker": ticker.upper(),
-            "currentPrice": safe_float(info.get("currentPrice") or info.get("regularMarketPrice")),
-            "previousClose": safe_float(info.get("previousClose")),
-            "open": safe_float(info.get("regularMarketOpen") or info.get("open")),
-            "dayHigh": safe_float(info.get("dayHigh")),
-            "dayLow": safe_float(info.get("dayLow")),
-            "volume": safe_float(info.get("volume")),
-            "marketCap": safe_float(info.get("marketCap")),
-            "fiftyTwoWeekHigh": safe_float(info.get("fiftyTwoWeekHigh")),
-            "fiftyTwoWeekLow": safe_float(info.get("fiftyTwoWeekLow")),
-            "currency": info.get("currency", "USD"),
-            "exchange": info.get("exchange"),
-            "longName": info.get("longName") or info.get("shortName"),
-        }
-        
-        # Remove None values to keep response clean
-        result = {k: v for k, v in result.items() if v is not None}
+        # Extract key price and market data; safe_float drops NaN values
+        result = _pick_fields(info, STOCK_PRICE_FIELDS, {"ticker": ticker.upper()})
+        result.setdefault("currency", "USD")
         
         if len(result) <= 1:  # Only ticker, no actual data
             return {
@@ -90,11 +194,58 @@ def get_stock_price(ticker: str, tool_context: ToolContext) -> Dict[str, Any]:
         return {"ticker": ticker.upper(), "error": f"Failed to fetch stock price: {str(e)}"}
 
 
+def _map_tickers(
+    fetch: Callable[[str, ToolContext], Dict[str, Any]],
+    tickers: List[str],
+    tool_context: ToolContext,
+) -> Dict[str, Any]:
+    """
+    Run a single-ticker tool for several tickers concurrently.
+
+    The fetches are network-bound, so a thread pool overlaps the HTTPS round-trips
+    instead of paying for them one after another. Duplicate symbols are fetched once.
+    """
+    symbols = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    if not symbols:
+        return {"error": "No ticker symbols provided"}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(symbols))) as executor:
+        results = executor.map(lambda symbol: fetch(symbol, tool_context), symbols)
+        return {
+            "tickers": symbols,
+            "data": dict(zip(symbols, results)),
+        }
+
+
+def get_stock_prices_batch(tickers: List[str], tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Fetches current price data for several ticker symbols in one call.
+    
+    Use this instead of repeated get_stock_price calls when comparing multiple stocks.
+    Each entry has the same shape as a get_stock_price result.
+    
+    Args:
+        tickers: List of stock ticker symbols (e.g., ["AAPL", "MSFT", "GOOGL"]).
+        tool_context: The ADK ToolContext object.
+    
+    Returns:
+        A dictionary mapping each upper-cased ticker to its price data.
+    
+    Example:
+        {"tickers": ["AAPL", "MSFT"], "data": {"AAPL": {"currentPrice": 185.50, ...}, "MSFT": {...}}}
+    """
+    return _map_tickers(get_stock_price, tickers, tool_context)
+
+
+@cached(ttl=HISTORY_TTL)
 def get_historical_data(
     ticker: str, 
     period: str = "1mo",
     start_date: Optional[str] = None, 
     end_date: Optional[str] = None,
+    resample: Optional[str] = None,
+    max_points: Optional[int] = None,
+    output_format: Literal["records", "columns"] = "records",
     tool_context: ToolContext = None
 ) -> Dict[str, Any]:
     """
@@ -102,6 +253,9 @@ def get_historical_data(
     
     Uses yfinance Ticker.history() method to retrieve historical market data.
     Can specify either a period (e.g., "1mo", "1y") or specific start/end dates.
+    Long windows can be shrunk with resample (aggregated weekly/monthly bars that
+    keep the true highs and lows, each dated by its last trading day) and/or
+    max_points (keeps every Nth bar, always including the most recent one).
     
     Args:
         ticker: The stock ticker symbol.
@@ -109,23 +263,51 @@ def get_historical_data(
                 Only used if start_date and end_date are not provided.
         start_date: The start date in "YYYY-MM-DD" format (optional).
         end_date: The end date in "YYYY-MM-DD" format (optional).
+        resample: Bar size to aggregate daily bars into: "W" (weekly) or "M" (monthly) (optional).
+        max_points: Maximum number of bars to return (optional).
+        output_format: "records" (one dict per bar) or "columns" (one list per field,
+                       where date[i] belongs to open[i], high[i], ...). Columns are
+                       much more compact for long histories.
         tool_context: The ADK ToolContext object.
     
     Returns:
-        A dictionary containing historical OHLCV (Open, High, Low, Close, Volume) data.
+        A dictionary containing historical OHLCV (Open, High, Low, Close, Volume) data
+        and a "sampling" field describing the bar cadence.
     
     Example:
         {
             "ticker": "AAPL",
             "period": "1mo",
+            "sampling": "daily",
             "data": [
                 {"date": "2024-01-15", "open": 185.0, "high": 187.5, "low": 184.0, "close": 186.5, "volume": 52300000},
                 ...
             ]
         }
+        
+        With output_format="columns", "data" is instead:
+            {"date": ["2024-01-15", ...], "open": [185.0, ...], ..., "volume": [52300000, ...]}
     """
+    if resample is not None and resample.upper() not in RESAMPLE_RULES:
+        return {
+            "ticker": ticker.upper(),
+            "error": f"Unsupported resample value '{resample}'. Use one of: {', '.join(RESAMPLE_RULES)}"
+        }
+    
+    if max_points is not None and max_points <= 0:
+        return {
+            "ticker": ticker.upper(),
+            "error": f"max_points must be a positive integer, got {max_points}"
+        }
+    
+    if output_format not in ("records", "columns"):
+        return {
+            "ticker": ticker.upper(),
+            "error": f"Unsupported output_format '{output_format}'. Use 'records' or 'columns'"
+        }
+    
     try:
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         
         # Fetch historical data
         if start_date and end_date:
@@ -141,28 +323,29 @@ def get_historical_data(
                 "error": "No historical data available for the specified period"
             }
         
-        # Convert DataFrame to list of dicts with date as string
-        # Filter out NaN and invalid values
-        hist_data = []
-        for date, row in hist.iterrows():
-            # Check if any values are NaN or infinity
-            if (pd.notna(row['Open']) and pd.notna(row['High']) and 
-                pd.notna(row['Low']) and pd.notna(row['Close']) and 
-                pd.notna(row['Volume'])):
-                try:
-                    hist_data.append({
-                        "date": date.strftime("%Y-%m-%d"),
-                        "open": round(float(row['Open']), 2),
-                        "high": round(float(row['High']), 2),
-                        "low": round(float(row['Low']), 2),
-                        "close": round(float(row['Close']), 2),
-                        "volume": int(row['Volume'])
-                    })
-                except (ValueError, TypeError) as e:
-                    # Skip this row if conversion fails
-                    continue
-        
-        if not hist_data:
+        hist = _finite_ohlcv(hist)
+        
+        sampling = "daily"
+        if resample is not None:
+            rule, sampling = RESAMPLE_RULES[resample.upper()]
+            hist = (
+                hist[OHLCV_COLUMNS]
+                .assign(_last=hist.index)
+                .resample(rule)
+                .agg({**OHLCV_AGGREGATION, "_last": "last"})
+                .dropna()
+                .set_index("_last")
+            )
+        
+        if max_points is not None and len(hist) > max_points:
+            # Stride from the newest bar backwards so the latest close is always kept
+            step = len(hist) // max_points + 1
+            hist = hist.iloc[(len(hist) - 1) % step::step]
+            sampling = f"{sampling}, every {step} bars"
+        
+        frame = _ohlcv_frame(hist)
+        
+        if frame.empty:
             return {
                 "ticker": ticker.upper(),
                 "error": "No valid historical data points found (all values were NaN or invalid)"
@@ -171,18 +354,310 @@ def get_historical_data(
         return {
             "ticker": ticker.upper(),
             "period": period_used,
-            "dataPoints": len(hist_data),
-            "data": hist_data
+            "sampling": sampling,
+            "dataPoints": len(frame),
+            "data": frame.to_dict(orient="list" if output_format == "columns" else "records")
         }
     except Exception as e:
         return {"ticker": ticker.upper(), "error": f"Failed to fetch historical data: {str(e)}"}
 
 
+@cached(ttl=HISTORY_TTL)
+def get_historical_data_batch(
+    tickers: List[str],
+    period: str = "6mo",
+    tool_context: ToolContext = None
+) -> Dict[str, Any]:
+    """
+    Fetches daily historical stock data for several ticker symbols in one call.
+    
+    Uses yf.download(), which retrieves all symbols with its own thread pool. Use
+    this instead of repeated get_historical_data calls when comparing peers.
+    Each entry has the same shape as a get_historical_data result.
+    
+    Args:
+        tickers: List of stock ticker symbols (e.g., ["AAPL", "MSFT", "GOOGL"]).
+        period: Valid periods: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
+        tool_context: The ADK ToolContext object.
+    
+    Returns:
+        A dictionary mapping each upper-cased ticker to its historical OHLCV data.
+    
+    Example:
+        {
+            "tickers": ["AAPL", "MSFT"],
+            "data": {
+                "AAPL": {"ticker": "AAPL", "period": "6mo", "dataPoints": 126, "data": [...]},
+                "MSFT": {...}
+            }
+        }
+    """
+    symbols = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    if not symbols:
+        return {"error": "No ticker symbols provided"}
+    
+    try:
+        df = yf.download(
+            symbols,
+            period=period,
+            group_by="ticker",
+            threads=min(MAX_BATCH_WORKERS, len(symbols)),
+            progress=False,
+            multi_level_index=True,
+        )
+        
+        downloaded = set(df.columns.get_level_values(0)) if not df.empty else set()
+        data = {}
+        for symbol in symbols:
+            hist = _finite_ohlcv(df[symbol]) if symbol in downloaded else None
+            if hist is None or hist.empty:
+                data[symbol] = {
+                    "ticker": symbol,
+                    "error": "No historical data available for the specified period"
+                }
+                continue
+            frame = _ohlcv_frame(hist)
+            data[symbol] = {
+                "ticker": symbol,
+                "period": period,
+                "sampling": "daily",
+                "dataPoints": len(frame),
+                "data": frame.to_dict(orient="records"),
+            }
+        
+        return {"tickers": symbols, "data": data}
+    except Exception as e:
+        return {"tickers": symbols, "error": f"Failed to fetch historical data: {str(e)}"}
+
+
+def _last_value(values: np.ndarray) -> Optional[float]:
+    """Last element of an indicator series rounded to cents, or None if undefined."""
+    if values.size == 0 or not np.isfinite(values[-1]):
+        return None
+    return round(float(values[-1]), 2)
+
+
+@cached(ttl=HISTORY_TTL)
+def get_technical_levels(
+    ticker: str,
+    period: str = "1y",
+    tool_context: ToolContext = None
+) -> Dict[str, Any]:
+    """
+    Computes key technical levels for a ticker from its daily price history.
+    
+    Moving averages, Average True Range, pivot points and recent swing
+    highs/lows are calculated locally, so only the resulting levels are returned
+    instead of every OHLCV row.
+    
+    Args:
+        ticker: The stock ticker symbol.
+        period: History used for the calculations: 6mo, 1y, 2y, 5y, 10y, max.
+                At least 1y is needed for the 200-day moving average.
+        tool_context: The ADK ToolContext object.
+    
+    Returns:
+        A dictionary with the latest close, SMA-20/50/200, ATR-14, pivot points,
+        and support/resistance levels sorted from nearest to farthest.
+    
+    Example:
+        {
+            "ticker": "AAPL",
+            "close": 186.5,
+            "sma50": 181.2,
+            "sma200": 175.9,
+            "atr14": 3.15,
+            "support": [184.0, 180.1],
+            "resistance": [190.3, 199.6],
+            ...
+        }
+    """
+    try:
+        stock = _ticker(ticker)
+        hist = stock.history(period=period)
+        
+        if hist.empty:
+            return {
+                "ticker": ticker.upper(),
+                "error": "No historical data available for the specified period"
+            }
+        
+        prices = hist[["High", "Low", "Close"]].to_numpy(dtype=np.float64)
+        prices = prices[np.isfinite(prices).all(axis=1)]
+        if len(prices) < 2:
+            return {
+                "ticker": ticker.upper(),
+                "error": "Not enough valid price data to compute technical levels"
+            }
+        high = np.ascontiguousarray(prices[:, 0])
+        low = np.ascontiguousarray(prices[:, 1])
+        close = np.ascontiguousarray(prices[:, 2])
+        last_close = float(close[-1])
+        
+        # Classic floor-trader pivots from the latest bar
+        pivot = (high[-1] + low[-1] + close[-1]) / 3
+        bar_range = high[-1] - low[-1]
+        pivots = {
+            "pivot": round(float(pivot), 2),
+            "r1": round(float(2 * pivot - low[-1]), 2),
+            "r2": round(float(pivot + bar_range), 2),
+            "s1": round(float(2 * pivot - high[-1]), 2),
+            "s2": round(float(pivot - bar_range), 2),
+        }
+        
+        # Swing lows/highs over the last 20 and 50 sessions plus the pivot levels
+        levels = [pivots["s1"], pivots["s2"], pivots["r1"], pivots["r2"]]
+        for window in (20, 50):
+            if len(close) >= window:
+                levels.append(_last_value(_indicators.rolling_min(low, window)))
+                levels.append(_last_value(_indicators.rolling_max(high, window)))
+        levels = {level for level in levels if level is not None}
+        
+        result = {
+            "ticker": ticker.upper(),
+            "period": period,
+            "dataPoints": len(close),
+            "close": round(last_close, 2),
+            "sma20": _last_value(_indicators.sma(close, 20)),
+            "sma50": _last_value(_indicators.sma(close, 50)),
+            "sma200": _last_value(_indicators.sma(close, 200)),
+            "atr14": _last_value(_indicators.atr(high, low, close, 14)),
+            "pivots": pivots,
+            "support": sorted((lvl for lvl in levels if lvl < last_close), reverse=True),
+            "resistance": sorted(lvl for lvl in levels if lvl > last_close),
+        }
+        
+        # Remove None values (e.g. sma200 on short histories)
+        return {k: v for k, v in result.items() if v is not None}
+    except Exception as e:
+        return {"ticker": ticker.upper(), "error": f"Failed to compute technical levels: {str(e)}"}
+
+
+@cached(ttl=QUOTE_TTL)
+def get_quote_with_history(
+    ticker: str,
+    period: str = "1y",
+    tool_context: ToolContext = None
+) -> Dict[str, Any]:
+    """
+    Fetches a price snapshot, 52-week range and moving averages from one history request.
+    
+    Everything is derived from the daily bars, so this is a lighter alternative to
+    get_stock_price plus get_historical_data when company metadata and market cap
+    are not needed.
+    
+    Args:
+        ticker: The stock ticker symbol.
+        period: History to download: 1y, 2y, 5y, 10y, max. At least 1y is needed
+                for the 52-week range and the 200-day moving average.
+        tool_context: The ADK ToolContext object.
+    
+    Returns:
+        A dictionary with the latest close as currentPrice, the previous close, the
+        latest bar's open/high/low/volume, the 52-week high/low and SMA-50/200.
+    
+    Example:
+        {
+            "ticker": "AAPL",
+            "asOf": "2024-01-15",
+            "currentPrice": 185.50,
+            "previousClose": 184.20,
+            "fiftyTwoWeekHigh": 199.62,
+            "fiftyTwoWeekLow": 164.08,
+            "sma50": 181.2,
+            "sma200": 175.9,
+            ...
+        }
+    """
+    try:
+        stock = _ticker(ticker)
+        hist = stock.history(period=period)
+        
+        if not hist.empty:
+            hist = _finite_ohlcv(hist)
+        if hist.empty:
+            return {
+                "ticker": ticker.upper(),
+                "error": "No historical data available for the specified period"
+            }
+        
+        close = hist["Close"].to_numpy(dtype=np.float64)
+        year = hist[hist.index >= hist.index[-1] - pd.DateOffset(weeks=52)]
+        last = hist.iloc[-1]
+        
+        result = {
+            "ticker": ticker.upper(),
+            "asOf": hist.index[-1].strftime("%Y-%m-%d"),
+            "currentPrice": round(float(close[-1]), 2),
+            "previousClose": round(float(close[-2]), 2) if len(close) > 1 else None,
+            "open": round(float(last["Open"]), 2),
+            "dayHigh": round(float(last["High"]), 2),
+            "dayLow": round(float(last["Low"]), 2),
+            "volume": int(last["Volume"]),
+            "fiftyTwoWeekHigh": round(float(year["High"].max()), 2),
+            "fiftyTwoWeekLow": round(float(year["Low"].min()), 2),
+            "sma50": _last_value(_indicators.sma(close, 50)),
+            "sma200": _last_value(_indicators.sma(close, 200)),
+        }
+        
+        # Remove None values (e.g. sma200 on short histories)
+        return {k: v for k, v in result.items() if v is not None}
+    except Exception as e:
+        return {"ticker": ticker.upper(), "error": f"Failed to fetch quote with history: {str(e)}"}
+
+
+# (output key, info keys in order of preference, converter) for get_financial_info
+FINANCIAL_INFO_FIELDS = (
+    # Company Info
+    ("companyName", ("longName", "shortName"), None),
+    ("sector", ("sector",), None),
+    ("industry", ("industry",), None),
+    ("website", ("website",), None),
+    ("description", ("longBusinessSummary",), None),
+    ("country", ("country",), None),
+    ("employees", ("fullTimeEmployees",), None),
+
+    # Financial Metrics
+    ("marketCap", ("marketCap",), safe_float),
+    ("trailingPE", ("trailingPE",), safe_float),
+    ("forwardPE", ("forwardPE",), safe_float),
+    ("priceToBook", ("priceToBook",), safe_float),
+    ("earningsPerShare", ("trailingEps",), safe_float),
+    ("revenuePerShare", ("revenuePerShare",), safe_float),
+    ("profitMargins", ("profitMargins",), safe_float),
+    ("operatingMargins", ("operatingMargins",), safe_float),
+
+    # Revenue & Earnings
+    ("totalRevenue", ("totalRevenue",), safe_float),
+    ("revenueGrowth", ("revenueGrowth",), safe_float),
+    ("earningsGrowth", ("earningsGrowth",), safe_float),
+
+    # Analyst Data
+    ("targetMeanPrice", ("targetMeanPrice",), safe_float),
+    ("targetHighPrice", ("targetHighPrice",), safe_float),
+    ("targetLowPrice", ("targetLowPrice",), safe_float),
+    ("recommendationKey", ("recommendationKey",), None),
+    ("numberOfAnalystOpinions", ("numberOfAnalystOpinions",), safe_float),
+
+    # Dividend Info
+    ("dividendRate", ("dividendRate",), safe_float),
+    ("dividendYield", ("dividendYield",), safe_float),
+    ("payoutRatio", ("payoutRatio",), safe_float),
+    ("exDividendDate", ("exDividendDate",), None),
+
+    # Trading Info
+    ("beta", ("beta",), safe_float),
+    ("averageVolume", ("averageVolume",), safe_float),
+    ("averageVolume10days", ("averageVolume10days",), safe_float),
+)
+
+
+@cached(ttl=FUNDAMENTALS_TTL)
 def get_financial_info(ticker: str, tool_context: ToolContext) -> Dict[str, Any]:
     """
     Fetches comprehensive financial information for a given ticker.
     
-    Uses yfinance Ticker.info to get detailed company and financial data including:
+    Reads only the quoteSummary modules it needs to get detailed company and financial data including:
     - Company information (sector, industry, description)
     - Financial metrics (P/E ratio, EPS, revenue, profit margins)
     - Analyst recommendations
@@ -206,62 +681,69 @@ def get_financial_info(ticker: str, tool_context: ToolContext) -> Dict[str, Any]
         }
     """
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = fetch_modules(ticker, FINANCIAL_INFO_MODULES)
         
-        result = {
-            "ticker": ticker.upper(),
-            # Company Info
-            "companyName": info.get("longName") or info.get("shortName"),
-            "sector": info.get("sector"),
-            "industry": info.get("industry"),
-            "website": info.get("website"),
-            "description": info.get("longBusinessSummary"),
-            "country": info.get("country"),
-            "employees": info.get("fullTimeEmployees"),
-            
-            # Financial Metrics
-            "marketCap": safe_float(info.get("marketCap")),
-            "trailingPE": safe_float(info.get("trailingPE")),
-            "forwardPE": safe_float(info.get("forwardPE")),
-            "priceToBook": safe_float(info.get("priceToBook")),
-            "earningsPerShare": safe_float(info.get("trailingEps")),
-            "revenuePerShare": safe_float(info.get("revenuePerShare")),
-            "profitMargins": safe_float(info.get("profitMargins")),
-            "operatingMargins": safe_float(info.get("operatingMargins")),
-            
-            # Revenue & Earnings
-            "totalRevenue": safe_float(info.get("totalRevenue")),
-            "revenueGrowth": safe_float(info.get("revenueGrowth")),
-            "earningsGrowth": safe_float(info.get("earningsGrowth")),
-            
-            # Analyst Data
-            "targetMeanPrice": safe_float(info.get("targetMeanPrice")),
-            "targetHighPrice": safe_float(info.get("targetHighPrice")),
-            "targetLowPrice": safe_float(info.get("targetLowPrice")),
-            "recommendationKey": info.get("recommendationKey"),
-            "numberOfAnalystOpinions": safe_float(info.get("numberOfAnalystOpinions")),
-            
-            # Dividend Info
-            "dividendRate": safe_float(info.get("dividendRate")),
-            "dividendYield": safe_float(info.get("dividendYield")),
-            "payoutRatio": safe_float(info.get("payoutRatio")),
-            "exDividendDate": info.get("exDividendDate"),
-            
-            # Trading Info
-            "beta": safe_float(info.get("beta")),
-            "averageVolume": safe_float(info.get("averageVolume")),
-            "averageVolume10days": safe_float(info.get("averageVolume10days")),
-        }
-        
-        # Remove None values
-        result = {k: v for k, v in result.items() if v is not None}
-        
-        return result
+        return _pick_fields(info, FINANCIAL_INFO_FIELDS, {"ticker": ticker.upper()})
     except Exception as e:
         return {"ticker": ticker.upper(), "error": f"Failed to fetch financial info: {str(e)}"}
 
 
+def get_financial_info_batch(tickers: List[str], tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Fetches financial information for several ticker symbols in one call.
+    
+    Use this instead of repeated get_financial_info calls when comparing multiple
+    companies. Each entry has the same shape as a get_financial_info result.
+    
+    Args:
+        tickers: List of stock ticker symbols (e.g., ["AAPL", "MSFT", "GOOGL"]).
+        tool_context: The ADK ToolContext object.
+    
+    Returns:
+        A dictionary mapping each upper-cased ticker to its financial information.
+    
+    Example:
+        {"tickers": ["AAPL", "MSFT"], "data": {"AAPL": {"companyName": "Apple Inc.", ...}, "MSFT": {...}}}
+    """
+    return _map_tickers(get_financial_info, tickers, tool_context)
+
+
+@cached(ttl=HISTORY_TTL)
+def _earnings_table(ticker: str) -> Dict[str, Any]:
+    """
+    Earnings rows for get_earnings_dates plus the report times needed to find the next one.
+    
+    Cached on its own so "upcoming" is worked out from the current time on every
+    call; the hourly TTL keeps reported EPS from lagging a release for long.
+    """
+    stock = _ticker(ticker)
+    earnings_dates = stock.earnings_dates
+    
+    if earnings_dates is None or earnings_dates.empty:
+        return {
+            "ticker": ticker.upper(),
+            "message": "No earnings dates available"
+        }
+    
+    # Convert to list of dicts; missing columns come back as None
+    columns = earnings_dates.reindex(columns=["EPS Estimate", "Reported EPS", "Surprise(%)"])
+    earnings_list = pd.DataFrame({
+        "date": _date_strings(earnings_dates.index),
+        "epsEstimate": _float_or_none(columns["EPS Estimate"]),
+        "reportedEPS": _float_or_none(columns["Reported EPS"]),
+        "surprise": _float_or_none(columns["Surprise(%)"]),
+    }).to_dict(orient="records")
+    
+    # Report times (epoch seconds) in ascending order, with their display dates
+    dates = earnings_dates.index.sort_values()
+    return {
+        "ticker": ticker.upper(),
+        "data": earnings_list,
+        "reportTimes": dates.as_unit("s").asi8.tolist(),
+        "reportDates": _date_strings(dates).tolist(),
+    }
+
+
 def get_earnings_dates(ticker: str, tool_context: ToolContext) -> Dict[str, Any]:
     """
     Fetches upcoming and historical earnings dates for a ticker.
@@ -283,43 +765,25 @@ def get_earnings_dates(ticker: str, tool_context: ToolContext) -> Dict[str, Any]
         }
     """
     try:
-        stock = yf.Ticker(ticker)
-        earnings_dates = stock.earnings_dates
+        table = _earnings_table(ticker)
+        if "data" not in table:
+            return table
         
-        if earnings_dates is None or earnings_dates.empty:
-            return {
-                "ticker": ticker.upper(),
-                "message": "No earnings dates available"
-            }
-        
-        # Convert to list of dicts
-        earnings_list = []
-        for date, row in earnings_dates.iterrows():
-            earnings_list.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "epsEstimate": float(row.get('EPS Estimate', 0)) if pd.notna(row.get('EPS Estimate')) else None,
-                "reportedEPS": float(row.get('Reported EPS', 0)) if pd.notna(row.get('Reported EPS')) else None,
-                "surprise": float(row.get('Surprise(%)', 0)) if pd.notna(row.get('Surprise(%)')) else None,
-            })
-        
-        # Get next earnings date (first future date or most recent)
-        upcoming = None
-        today = datetime.now()
-        for item in earnings_list:
-            item_date = datetime.strptime(item['date'], "%Y-%m-%d")
-            if item_date >= today:
-                upcoming = item['date']
-                break
+        # Next earnings date: binary search for now in the ascending report times
+        report_times = table["reportTimes"]
+        pos = int(np.searchsorted(report_times, time.time()))
+        upcoming = table["reportDates"][pos] if pos < len(report_times) else None
         
         return {
             "ticker": ticker.upper(),
             "upcomingEarningsDate": upcoming,
-            "data": earnings_list[:10]  # Limit to 10 most recent/upcoming
+            "data": table["data"][:10]  # Limit to 10 most recent/upcoming
         }
     except Exception as e:
         return {"ticker": ticker.upper(), "error": f"Failed to fetch earnings dates: {str(e)}"}
 
 
+@cached(ttl=FUNDAMENTALS_TTL)
 def get_analyst_recommendations(ticker: str, tool_context: ToolContext) -> Dict[str, Any]:
     """
     Fetches recent analyst recommendations and upgrades/downgrades.
@@ -343,7 +807,7 @@ def get_analyst_recommendations(ticker: str, tool_context: ToolContext) -> Dict[
         }
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         recommendations = stock.recommendations
         
         if recommendations is None or recommendations.empty:
@@ -364,15 +828,18 @@ def get_analyst_recommendations(ticker: str, tool_context: ToolContext) -> Dict[
         # Get recent recommendations (last 20)
         recent = recommendations.tail(20)
         
-        recs_list = []
-        for date, row in recent.iterrows():
-            recs_list.append({
-                "date": date.strftime("%Y-%m-%d") if hasattr(date, 'strftime') else str(date),
-                "firm": str(row.get('Firm', '')),
-                "toGrade": str(row.get('To Grade', '')),
-                "fromGrade": str(row.get('From Grade', '')) if pd.notna(row.get('From Grade')) else None,
-                "action": str(row.get('Action', '')) if pd.notna(row.get('Action')) else None,
-            })
+        if isinstance(recent.index, pd.DatetimeIndex):
+            dates = _date_strings(recent.index)
+        else:
+            dates = recent.index.astype(str)
+        columns = recent.reindex(columns=["Firm", "To Grade", "From Grade", "Action"])
+        recs_list = pd.DataFrame({
+            "date": dates,
+            "firm": _str_or_none(columns["Firm"]).fillna(""),
+            "toGrade": _str_or_none(columns["To Grade"]).fillna(""),
+            "fromGrade": _str_or_none(columns["From Grade"]),
+            "action": _str_or_none(columns["Action"]),
+        }).to_dict(orient="records")
         
         return {
             "ticker": ticker.upper(),